@@ -5,19 +5,26 @@ from enum import Enum
 AUTH_APIKEY_NAME = "pyUnfoldedCircle"
 AUTH_USERNAME = "web-configurator"
 WS_RECONNECTION_DELAY = 30  # seconds
+ACTIVITY_STATE_CACHE_TTL = 1  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 300  # seconds
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 10
+HTTP_DNS_CACHE_TTL = 300  # seconds
+URL_CACHE_SIZE = 128
 ZEROCONF_TIMEOUT = 3
 ZEROCONF_SERVICE_TYPE = "_uc-remote._tcp.local."
 SIMULATOR_MAC_ADDRESS = "aa:bb:cc:dd:ee:ff"
 SIMULATOR_NAMES = ["Remote Two Simulator", "Remote 3 Simulator"]
 
-SYSTEM_COMMANDS = [
+SYSTEM_COMMANDS: tuple[str, ...] = (
     "STANDBY",
     "REBOOT",
     "POWER_OFF",
     "RESTART",
     "RESTART_UI",
     "RESTART_CORE",
-]
+)
+SYSTEM_COMMANDS_SET: frozenset[str] = frozenset(SYSTEM_COMMANDS)
 
 
 class RemoteUpdateType(Enum):
@@ -2,13 +2,15 @@
 
 import logging
 import asyncio
-import re
-import json
+from contextlib import asynccontextmanager
 from enum import Enum
+from typing import AsyncIterator
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
 
+from .helpers import close_session, json_dumps, json_loads, read_json
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -86,6 +88,8 @@ class ApiKeyNotFound(Exception):
 class Dock:
     """Unfolded Circle Dock Class."""
 
+    _TIMEOUT = aiohttp.ClientTimeout(total=5)
+
     def __init__(
         self,
         dock_id: str,
@@ -140,6 +144,15 @@ class Dock:
         self.apikey = apikey
         self._remote_configuration_url = remote_configuration_url
         self.websocket = ""
+        self._session: aiohttp.ClientSession | None = None
+        self._session_apikey: str | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> "Dock":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     @property
     def name(self):
@@ -306,14 +319,10 @@ class Dock:
     ### URL Helpers ###
     def validate_url(self, uri):
         """Validate passed in URL and attempts to correct api endpoint if path isn't supplied."""
-        if re.search("^http.*", uri) is None:
-            uri = (
-                "http://" + uri
-            )  # Normalize to absolute URLs so urlparse will parse the way we want
-        parsed_url = urlparse(uri)
-        # valdation = set(uri)
-        if parsed_url.scheme == "":
+        if not uri.startswith(("http://", "https://")):
+            # Normalize to absolute URLs so urlparse will parse the way we want
             uri = "http://" + uri
+        parsed_url = urlparse(uri)
         if parsed_url.path == "/":  # Only host supplied
             uri = uri + "api/"
             return uri
@@ -347,16 +356,45 @@ class Dock:
         return False
 
     ### HTTP methods ###
-    def client(self) -> aiohttp.ClientSession:
-        """Create a aiohttp client object with needed headers and defaults."""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the persistent aiohttp session, creating it on first use.
+
+        The session is rebuilt when the api key changes and when it is used
+        from another event loop than the one it was built on."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_apikey == self.apikey
+            and self._session_loop is loop
+        ):
+            return self._session
+
+        old_session = self._session
+        old_loop = self._session_loop
+        headers = {"Accept": "application/json"}
         if self.apikey:
-            headers = {
-                "Authorization": "Bearer " + self.apikey,
-                "Accept": "application/json",
-            }
-            return aiohttp.ClientSession(
-                headers=headers, timeout=aiohttp.ClientTimeout(total=5)
-            )
+            headers["Authorization"] = "Bearer " + self.apikey
+        self._session = aiohttp.ClientSession(
+            headers=headers, timeout=self._TIMEOUT, json_serialize=json_dumps
+        )
+        self._session_apikey = self.apikey
+        self._session_loop = loop
+        if old_session is not None and not old_session.closed:
+            await close_session(old_session, old_loop)
+        return self._session
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the persistent aiohttp client with needed headers and defaults."""
+        yield await self._get_session()
+
+    async def close(self) -> None:
+        """Close the persistent aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await close_session(self._session, self._session_loop)
+        self._session = None
+        self._session_loop = None
 
     async def validate_connection(self) -> bool:
         """Validate we can communicate with the remote given the supplied information."""
@@ -371,7 +409,7 @@ class Dock:
     async def raise_on_error(self, response):
         """Raise an HTTP error if the response returns poorly."""
         if not response.ok:
-            content = await response.json()
+            content = await read_json(response)
             msg = f"{response.status} Request: {content['code']} Reason: {content['message']}"
             raise HTTPError(response.status, msg)
         return response
@@ -383,7 +421,7 @@ class Dock:
             session.get(self.url(f"docks/devices/{self.id}")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._name = information.get("name")
             self._ws_endpoint = information.get("resolved_ws_url")
             self._is_active = information.get("active")
@@ -405,7 +443,7 @@ class Dock:
             session.get(self.url(f"docks/devices/{self.id}/update")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._latest_software_version = information.get("version")
             self._available_update = information.get("update_available")
             self._check_for_updates = information.get("update_check_enabled")
@@ -419,7 +457,7 @@ class Dock:
             session.put(self.url(f"ir/emitters/{self.id}/learn")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
 
             return information
 
@@ -430,7 +468,7 @@ class Dock:
             session.delete(self.url(f"ir/emitters/{self.id}/learn")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
 
             return information
 
@@ -442,7 +480,7 @@ class Dock:
             session.get(self.url("remotes")) as response,
         ):
             await self.raise_on_error(response)
-            remotes = await response.json()
+            remotes = await read_json(response)
             for remote in remotes:
                 if remote.get("enabled") is True:
                     remote_data = {
@@ -464,7 +502,7 @@ class Dock:
                 session.get(self.url(f"remotes/{entity_id}")) as response,
             ):
                 await self.raise_on_error(response)
-                remote_info = await response.json()
+                remote_info = await read_json(response)
                 self._remotes_complete.append(remote_info.copy())
         return self._remotes_complete
 
@@ -475,7 +513,7 @@ class Dock:
             session.get(self.url("ir/codes/custom")) as response,
         ):
             await self.raise_on_error(response)
-            codesets = await response.json()
+            codesets = await read_json(response)
             self._codesets = codesets
             return self._codesets
 
@@ -498,7 +536,7 @@ class Dock:
             session.post(self.url("remotes"), json=remote_data) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def add_remote_command_to_codeset(
         self,
@@ -517,7 +555,7 @@ class Dock:
                 json=ir_data,
             ) as response,
         ):
-            codeset = await response.json()
+            codeset = await read_json(response)
             if response.status == 422:
                 if update_if_exists:
                     codeset = await self.update_remote_command_in_codeset(
@@ -547,7 +585,7 @@ class Dock:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def send_command(
         self, command: DockCommand, command_value: str = None
@@ -563,11 +601,11 @@ class Dock:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     def update_from_message(self, message: any) -> None:
         """Update internal data from received websocket messages"""
-        data = json.loads(message)
+        data = json_loads(message)
         _LOGGER.debug("RC2 received websocket message %s", data)
         try:
             if data["type"] == "auth_required":
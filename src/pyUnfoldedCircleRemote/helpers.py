@@ -0,0 +1,50 @@
+"""Shared HTTP helpers for the Unfolded Circle Remote and Dock."""
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# orjson decodes and encodes noticeably faster than the stdlib when it is installed
+json_loads = orjson.loads if orjson else json.loads
+json_dumps = (lambda obj: orjson.dumps(obj).decode()) if orjson else json.dumps
+
+
+async def close_session(
+    session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a session that may have been created on another event loop."""
+    if loop is None or loop is asyncio.get_running_loop() or loop.is_closed():
+        # aiohttp only marks connectors of a closed loop as closed
+        await session.close()
+    elif loop.is_running():
+        # Hand the close over to the loop that still owns the connections
+        future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+        future.add_done_callback(_log_close_error)
+    elif session.connector is not None:
+        # Nothing runs the old loop any more, abandon its connections
+        session.connector._close()
+
+
+def _log_close_error(future) -> None:
+    """Log a failure to close a session on its own event loop."""
+    if not future.cancelled() and future.exception() is not None:
+        _LOGGER.debug("Error closing session: %s", future.exception())
+
+
+async def read_json(response: aiohttp.ClientResponse) -> any:
+    """Decode a JSON response body, None when the body is empty.
+
+    Content-Type is not checked since the firmware does not always set it."""
+    body = await response.read()
+    if not body.strip():
+        return None
+    return json_loads(body)
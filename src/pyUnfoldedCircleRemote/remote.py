@@ -5,21 +5,27 @@ import copy
 import datetime
 import json
 import logging
-import re
-import socket
 import time
+from functools import lru_cache, partial
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from urllib.parse import urljoin, urlparse
 from wakeonlan import send_magic_packet
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 
 import aiohttp
-import zeroconf
 
 from .const import (
+    ACTIVITY_STATE_CACHE_TTL,
     AUTH_APIKEY_NAME,
     AUTH_USERNAME,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
     SIMULATOR_MAC_ADDRESS,
-    SYSTEM_COMMANDS,
+    SYSTEM_COMMANDS_SET,
+    URL_CACHE_SIZE,
     ZEROCONF_SERVICE_TYPE,
     ZEROCONF_TIMEOUT,
     RemotePowerModes,
@@ -27,9 +33,13 @@ from .const import (
     SIMULATOR_NAMES,
 )
 from .dock import Dock
+from .helpers import close_session, json_dumps, json_loads, read_json
 
 _LOGGER = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_BYTES_TO_MIB = 1 / 1048576
+
 
 class HTTPError(Exception):
     """Raised when an HTTP operation fails."""
@@ -144,17 +154,111 @@ class RemoteGroup(list):
 class Remote:
     """Unfolded Circle Remote Class."""
 
+    __slots__ = (
+        "endpoint",
+        "configuration_url",
+        "_scheme",
+        "_netloc",
+        "apikey",
+        "pin",
+        "activity_groups",
+        "activities",
+        "_activities_by_id",
+        "_activity_state_map",
+        "_activity_state_time",
+        "_activity_state_fetch",
+        "_activity_state_waiters",
+        "_entities",
+        "_name",
+        "_model_name",
+        "_model_number",
+        "_serial_number",
+        "_hw_revision",
+        "_manufacturer",
+        "_mac_address",
+        "_ip_address",
+        "_hostname",
+        "_battery_level",
+        "_battery_status",
+        "_is_charging",
+        "_ambient_light_intensity",
+        "_display_auto_brightness",
+        "_display_brightness",
+        "_button_backlight",
+        "_button_backlight_brightness",
+        "_sound_effects",
+        "_sound_effects_volume",
+        "_haptic_feedback",
+        "_display_timeout",
+        "_wakeup_sensitivity",
+        "_sleep_timeout",
+        "_update_in_progress",
+        "_update_percent",
+        "_download_percent",
+        "_next_update_check_date",
+        "_sw_version",
+        "_check_for_updates",
+        "_automatic_updates",
+        "_available_update",
+        "_latest_sw_version",
+        "_release_notes_url",
+        "_release_notes",
+        "_online",
+        "_memory_total",
+        "_memory_available",
+        "_storage_total",
+        "_storage_available",
+        "_cpu_load",
+        "_cpu_load_one",
+        "_power_mode",
+        "_remotes",
+        "_ir_emitters",
+        "_ir_custom",
+        "_ir_codesets",
+        "_ir_codesets_by_name",
+        "_ir_emitters_by_name",
+        "_last_update_type",
+        "_is_simulator",
+        "_docks",
+        "_docks_by_id",
+        "_wake_if_asleep",
+        "_wake_on_lan",
+        "_wake_on_lan_retries",
+        "_wake_on_lan_available",
+        "_external_entity_configuration_available",
+        "_bt_enabled",
+        "_wifi_enabled",
+        "_new_web_configurator",
+        "_join_url",
+        "_urls_endpoint",
+        "_conditional_cache",
+        "_session",
+        "_session_credentials",
+        "_session_loop",
+    )
+
+    _CREATE_KEY_BODY = {"name": AUTH_APIKEY_NAME, "scopes": ["admin"]}
+    _APIKEY_TIMEOUT = aiohttp.ClientTimeout(total=5)
+    _PIN_TIMEOUT = aiohttp.ClientTimeout(total=2)
+
     def __init__(
         self, api_url, pin=None, apikey=None, wake_if_asleep: bool = True
     ) -> None:
         """Create a new UC Remote Object."""
         self.endpoint = self.validate_url(api_url)
+        self._join_url = None
+        self._urls_endpoint = None
         self.configuration_url = self.derive_configuration_url()
         self.apikey = apikey
         self.pin = pin
         self.activity_groups: list[ActivityGroup] = []
         self.activities: list[Activity] = []
-        self._entities: list[UCMediaPlayerEntity] = []
+        self._activities_by_id: dict[str, Activity] = {}
+        self._activity_state_map: dict[str, str] = {}
+        self._activity_state_time = 0.0
+        self._activity_state_fetch: asyncio.Task | None = None
+        self._activity_state_waiters: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._entities: dict[str, UCMediaPlayerEntity] = {}
         self._name = ""
         self._model_name = ""
         self._model_number = ""
@@ -201,9 +305,12 @@ class Remote:
         self._ir_emitters = []
         self._ir_custom = []
         self._ir_codesets = []
+        self._ir_codesets_by_name: dict[str, dict] = {}
+        self._ir_emitters_by_name: dict[str, dict] = {}
         self._last_update_type = RemoteUpdateType.NONE
         self._is_simulator = None
         self._docks: list[Dock] = []
+        self._docks_by_id: dict[str, Dock] = {}
         self._wake_if_asleep = wake_if_asleep
         self._wake_on_lan: bool = False
         self._wake_on_lan_retries = 2
@@ -212,6 +319,17 @@ class Remote:
         self._bt_enabled: bool = False
         self._wifi_enabled: bool = False
         self._new_web_configurator = True
+        # url -> (etag, last modified, decoded payload) for conditional GETs
+        self._conditional_cache: dict[str, tuple[str | None, str | None, any]] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._session_credentials: tuple[str | None, str | None] = (None, None)
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> "Remote":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     @property
     def name(self):
@@ -467,14 +585,10 @@ class Remote:
     ### URL Helpers ###
     def validate_url(self, uri):
         """Validate passed in URL and attempts to correct api endpoint if path isn't supplied."""
-        if re.search("^http.*", uri) is None:
-            uri = (
-                "http://" + uri
-            )  # Normalize to absolute URLs so urlparse will parse the way we want
-        parsed_url = urlparse(uri)
-        # valdation = set(uri)
-        if parsed_url.scheme == "":
+        if not uri.startswith(("http://", "https://")):
+            # Normalize to absolute URLs so urlparse will parse the way we want
             uri = "http://" + uri
+        parsed_url = urlparse(uri)
         if parsed_url.path == "/":  # Only host supplied
             uri = uri + "api/"
             return uri
@@ -489,15 +603,28 @@ class Remote:
 
     def derive_configuration_url(self) -> str:
         """Derive configuration url from endpoint url."""
-        parsed_url = urlparse(self.endpoint)
-        self.configuration_url = (
-            f"{parsed_url.scheme}://{parsed_url.netloc}/configurator/"
-        )
+        self._sync_endpoint()
+        self.configuration_url = f"{self._scheme}://{self._netloc}/configurator/"
         return self.configuration_url
 
     def url(self, path="/") -> str:
         """Join path with base url."""
-        return urljoin(self.endpoint, path)
+        self._sync_endpoint()
+        return self._join_url(path)
+
+    def _sync_endpoint(self) -> None:
+        """Refresh the values derived from endpoint when it is (re)assigned."""
+        if self._urls_endpoint == self.endpoint:
+            return
+        parsed_url = urlparse(self.endpoint)
+        self._scheme = parsed_url.scheme
+        self._netloc = parsed_url.netloc
+        # Joined urls of the previous endpoint are stale. The cache is bounded
+        # since paths can carry ids and user supplied query values
+        self._join_url = lru_cache(maxsize=URL_CACHE_SIZE)(
+            partial(urljoin, self.endpoint)
+        )
+        self._urls_endpoint = self.endpoint
 
     @staticmethod
     def url_is_secure(url) -> bool:
@@ -515,21 +642,70 @@ class Remote:
         return "Remote 3"
 
     ### HTTP methods ###
-    def client(self) -> aiohttp.ClientSession:
-        """Create a aiohttp client object with needed headers and defaults."""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the persistent aiohttp session, creating it on first use.
+
+        The session is rebuilt when the credentials it was created with change,
+        e.g. once create_api_key() replaces pin authentication with an api key,
+        and when it is used from another event loop than the one it was built on."""
+        credentials = (self.apikey, self.pin)
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_credentials == credentials
+            and self._session_loop is loop
+        ):
+            return self._session
+
+        old_session = self._session
+        old_loop = self._session_loop
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        )
         if self.apikey:
             headers = {
                 "Authorization": "Bearer " + self.apikey,
                 "Accept": "application/json",
             }
-            return aiohttp.ClientSession(
-                headers=headers, timeout=aiohttp.ClientTimeout(total=5)
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=self._APIKEY_TIMEOUT,
+                connector=connector,
+                json_serialize=json_dumps,
             )
-        if self.pin:
-            auth = aiohttp.BasicAuth(AUTH_USERNAME, self.pin)
-            return aiohttp.ClientSession(
-                auth=auth, timeout=aiohttp.ClientTimeout(total=2)
+        else:
+            auth = aiohttp.BasicAuth(AUTH_USERNAME, self.pin) if self.pin else None
+            self._session = aiohttp.ClientSession(
+                auth=auth,
+                timeout=self._PIN_TIMEOUT,
+                connector=connector,
+                json_serialize=json_dumps,
             )
+        self._session_credentials = credentials
+        self._session_loop = loop
+        if old_session is not None and not old_session.closed:
+            await close_session(old_session, old_loop)
+        return self._session
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the persistent aiohttp client with needed headers and defaults.
+
+        The session is shared between requests and is only closed by close()."""
+        yield await self._get_session()
+
+    async def close(self) -> None:
+        """Close the persistent aiohttp session and those of the remote's docks."""
+        for dock in self._docks:
+            await dock.close()
+        if self._session is not None and not self._session.closed:
+            await close_session(self._session, self._session_loop)
+        self._session = None
+        self._session_loop = None
 
     async def validate_connection(self) -> bool:
         """Validate we can communicate with the remote given the supplied information."""
@@ -562,11 +738,40 @@ class Remote:
     async def raise_on_error(self, response):
         """Raise an HTTP error if the response returns poorly."""
         if not response.ok:
-            content = await response.json()
+            content = await read_json(response)
             msg = f"{response.status} Request: {content['code']} Reason: {content['message']}"
             raise HTTPError(response.status, msg)
         return response
 
+    async def _get_json_conditional(self, path: str) -> any:
+        """GET a JSON payload, reusing the cached one while it is not modified.
+
+        Returns a deep copy, so callers may modify the result freely."""
+        url = self.url(path)
+        headers = {}
+        cached = self._conditional_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        async with (
+            self.client() as session,
+            session.get(url, headers=headers) as response,
+        ):
+            if response.status == 304 and cached:
+                return copy.deepcopy(cached[2])
+            await self.raise_on_error(response)
+            data = await read_json(response)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._conditional_cache[url] = (etag, last_modified, data)
+            else:
+                self._conditional_cache.pop(url, None)
+            return copy.deepcopy(data)
+
     ### Unfolded Circle API Keys ###
     async def get_api_keys(self) -> list[dict]:
         """Get all api Keys."""
@@ -577,18 +782,18 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def create_api_key(self) -> str:
         """Create api Key."""
-        body = {"name": AUTH_APIKEY_NAME, "scopes": ["admin"]}
-
         async with (
             self.client() as session,
-            session.post(self.url("auth/api_keys"), json=body) as response,
+            session.post(
+                self.url("auth/api_keys"), json=self._CREATE_KEY_BODY
+            ) as response,
         ):
             await self.raise_on_error(response)
-            api_info = await response.json()
+            api_info = await read_json(response)
             self.apikey = api_info["api_key"]
         return self.apikey
 
@@ -634,7 +839,7 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def get_registered_external_system(
         self,
@@ -648,7 +853,7 @@ class Remote:
                 session.get(self.url(f"auth/external/{system}")) as response,
             ):
                 await self.raise_on_error(response)
-                return await response.json()
+                return await read_json(response)
         raise ExternalSystemNotRegistered("Failed to get tokens from the remote")
 
     async def set_token_for_external_system(
@@ -683,7 +888,7 @@ class Remote:
                     self.url(f"auth/external/{system}"), json=body
                 ) as response,
             ):
-                content = await response.json()
+                content = await read_json(response)
                 if response.status == 422:
                     return await self.update_token_for_external_system(
                         system=system,
@@ -734,7 +939,7 @@ class Remote:
                 ) as response,
             ):
                 await self.raise_on_error(response)
-                return await response.json()
+                return await read_json(response)
         raise ExternalSystemNotRegistered("Failed to update token for the remote")
 
     async def delete_token_for_external_system(
@@ -756,7 +961,7 @@ class Remote:
                 ) as response,
             ):
                 await self.raise_on_error(response)
-                return await response.json()
+                return await read_json(response)
         raise ExternalSystemNotRegistered("Failed to delete token from the remote")
 
     async def is_external_system_valid(self, system) -> bool:
@@ -776,35 +981,41 @@ class Remote:
             _LOGGER.debug("Remote external system with token: %s", external_system)
             return True
 
-    async def get_integrations(self) -> list[dict]:
-        """Retrieves the list of integration instances."""
+    async def iter_integrations(self) -> AsyncIterator[dict]:
+        """Yields integration instances as each page is retrieved."""
         async with self.client() as session:
             page = 1
-            data: list[dict] = []
+            received = 0
             while True:
                 params = {"limit": 100, "page": page}
-                response = await session.get(self.url("intg/instances"), params=params)
-                await self.raise_on_error(response)
-                count = int(response.headers.get("pagination-count", 0))
-                data += await response.json()
-                if len(data) >= count:
+                async with session.get(
+                    self.url("intg/instances"), params=params
+                ) as response:
+                    await self.raise_on_error(response)
+                    count = int(response.headers.get("pagination-count", 0))
+                    instances = await read_json(response)
+                for instance in instances:
+                    yield instance
+                received += len(instances)
+                if received >= count or not instances:
                     break
                 page += 1
-            return data
+
+    async def get_integrations(self) -> list[dict]:
+        """Retrieves the list of integration instances."""
+        return [instance async for instance in self.iter_integrations()]
 
     async def put_integration(self, integration_id: str, command: str | None = None):
         """Update the given integration instance."""
-        async with self.client() as session:
-            if command:
-                response = await session.put(
-                    self.url(f"intg/instances/{integration_id}?cmd={command}")
-                )
-            else:
-                response = await session.put(
-                    self.url(f"intg/instances/{integration_id}")
-                )
+        path = f"intg/instances/{integration_id}"
+        if command:
+            path += f"?cmd={command}"
+        async with (
+            self.client() as session,
+            session.put(self.url(path)) as response,
+        ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def get_driver_instance(self, driver_id: str) -> dict[str]:
         """Retrieves the driver instance from its driver id"""
@@ -813,7 +1024,7 @@ class Remote:
             session.get(self.url(f"intg/drivers/{driver_id}")) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def create_driver_instance(self, driver_id: str, body: dict) -> str:
         """Retrieves the driver instance from its driver id"""
@@ -822,7 +1033,7 @@ class Remote:
             session.post(self.url(f"intg/drivers/{driver_id}"), json=body) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def get_integration_instance_by_driver_id(self, driver_id: str) -> dict:
         """Returns driver information for a given integration instance ID"""
@@ -847,11 +1058,11 @@ class Remote:
         }
         async with (
             aiohttp.ClientSession(
-                headers=headers, timeout=aiohttp.ClientTimeout(total=5)
+                headers=headers, timeout=Remote._APIKEY_TIMEOUT
             ) as session,
             session.get(base_url + "/pub/version") as response,
         ):
-            return await response.json()
+            return await read_json(response)
 
     async def get_version(self) -> dict[str]:
         """Get remote version information /pub/version"""
@@ -859,7 +1070,7 @@ class Remote:
             self.client() as session,
             session.get(self.url("pub/version")) as response,
         ):
-            information = await response.json()
+            information = await read_json(response)
             self._hostname = information.get("hostname", "")
             self._mac_address = information.get("address", "")
 
@@ -885,15 +1096,15 @@ class Remote:
         """Get System wifi information from remote. address."""
         if self._is_simulator:
             self._mac_address = SIMULATOR_MAC_ADDRESS
-            parsed_uri = urlparse(self.endpoint)
-            self._ip_address = parsed_uri.netloc
+            self._sync_endpoint()
+            self._ip_address = self._netloc
             return {"ip_address": self._ip_address, "address": self._mac_address}
         async with (
             self.client() as session,
             session.get(self.url("system/wifi")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._mac_address = information.get("address")
             self._ip_address = information.get("ip_address")
             return information
@@ -901,26 +1112,21 @@ class Remote:
     async def get_remote_information(self) -> str:
         """Get System information from remote. model_name,
         model_number, serial_number, hw_revision."""
-        async with (
-            self.client() as session,
-            session.get(self.url("system")) as response,
-        ):
-            await self.raise_on_error(response)
-            information = await response.json()
-            self._model_name = information.get("model_name")
-            self._model_number = information.get("model_number")
-            self._serial_number = information.get("serial_number")
-            self._hw_revision = information.get("hw_revision")
-
-            if self._model_name in SIMULATOR_NAMES:
-                self._is_simulator = True
-            return information
+        information = await self._get_json_conditional("system")
+        self._model_name = information.get("model_name")
+        self._model_number = information.get("model_number")
+        self._serial_number = information.get("serial_number")
+        self._hw_revision = information.get("hw_revision")
+
+        if self._model_name in SIMULATOR_NAMES:
+            self._is_simulator = True
+        return information
 
     async def get_remote_configuration(self) -> str:
         """Get System configuration from remote. User supplied remote name."""
         async with self.client() as session, session.get(self.url("cfg")) as response:
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._name = information.get("device").get("name")
             return information
 
@@ -931,7 +1137,7 @@ class Remote:
             session.get(self.url("intg/drivers")) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def start_driver_by_id(self, integration_id) -> list[dict[str, any]]:
         """Issue a command to the supplied integrations drivers on the remote."""
@@ -942,7 +1148,7 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def get_remote_integrations(self) -> list[dict[str, any]]:
         """List the integrations instances on the remote."""
@@ -951,7 +1157,7 @@ class Remote:
             session.get(self.url("intg/instances")) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def get_remote_integration_entities(
         self, integration_id, reload=False
@@ -968,7 +1174,7 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def set_remote_integration_entities(
         self, integration_id, entity_ids: list[dict[str, any]]
@@ -1001,7 +1207,7 @@ class Remote:
             session.get(self.url(f"entities?intg_ids={integration_id}")) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def add_remote_entities(self, integration_id, entity_ids: list[str]) -> bool:
         """Subscribe to the selected entities for the given integration id."""
@@ -1036,60 +1242,80 @@ class Remote:
             session.get(self.url("activities?limit=100")) as response,
         ):
             await self.raise_on_error(response)
-            for activity in await response.json():
-                new_activity = Activity(activity=activity, remote=self)
-                self.activities.append(new_activity)
-                response2 = await session.get(self.url("activities/" + new_activity.id))
-                data = await response2.json()
-                try:
-                    self.update_activity_entities(
-                        new_activity, data["options"]["included_entities"]
-                    )
-                except (KeyError, IndexError):
-                    pass
+            activities = await read_json(response)
+        # Refresh known activities in place so references held elsewhere stay valid
+        activities_by_id = {}
+        for activity_data in activities:
+            activity = self._activities_by_id.get(activity_data["entity_id"])
+            if activity:
+                activity._name = activity_data["name"]["en"]
+                activity._report_state(activity_data.get("attributes").get("state"))
+                # _get_activity_details below fills these in from the new data
+                activity._reset_details()
+            else:
+                activity = Activity(activity=activity_data, remote=self)
+            activities_by_id[activity.id] = activity
+        self._activities_by_id = activities_by_id
+        self.activities = list(activities_by_id.values())
+        await asyncio.gather(
+            *[self._get_activity_details(activity) for activity in self.activities]
+        )
+        return activities
 
-                button_mapping = await session.get(
-                    self.url("activities/" + new_activity.id + "/buttons")
+    async def _get_activity_details(self, activity: "Activity") -> None:
+        """Retrieve the included entities and button mapping of an activity."""
+        async with self.client() as session:
+            async with session.get(self.url("activities/" + activity.id)) as response:
+                data = await read_json(response)
+            try:
+                self.update_activity_entities(
+                    activity, data["options"]["included_entities"]
                 )
+            except (KeyError, IndexError):
+                pass
 
-                for button in await button_mapping.json():
-                    try:
-                        short_press = button.get("short_press")
-                    except Exception:
-                        continue
-                    match button.get("button"):
-                        case "VOLUME_UP":
-                            new_activity._volume_up_command = short_press
-                        case "VOLUME_DOWN":
-                            new_activity._volume_down_command = short_press
-                        case "MUTE":
-                            new_activity._volume_mute_command = short_press
-                        case "PREV":
-                            new_activity._prev_track_command = short_press
-                        case "NEXT":
-                            new_activity._next_track_command = short_press
-                        case "PLAY":
-                            new_activity._play_pause_command = short_press
-                        case "POWER":
-                            new_activity._power_command = short_press
-                        case "STOP":  # Remote 3
-                            new_activity._stop_command = short_press
-                        case _:
-                            pass
-            return await response.json()
+            async with session.get(
+                self.url("activities/" + activity.id + "/buttons")
+            ) as button_mapping:
+                buttons = await read_json(button_mapping)
+
+        for button in buttons:
+            try:
+                short_press = button.get("short_press")
+            except Exception:
+                continue
+            match button.get("button"):
+                case "VOLUME_UP":
+                    activity._volume_up_command = short_press
+                case "VOLUME_DOWN":
+                    activity._volume_down_command = short_press
+                case "MUTE":
+                    activity._volume_mute_command = short_press
+                case "PREV":
+                    activity._prev_track_command = short_press
+                case "NEXT":
+                    activity._next_track_command = short_press
+                case "PLAY":
+                    activity._play_pause_command = short_press
+                case "POWER":
+                    activity._power_command = short_press
+                case "STOP":  # Remote 3
+                    activity._stop_command = short_press
+                case _:
+                    pass
 
-    async def get_activities_state(self):
+    async def get_activities_state(self) -> dict[str, str]:
         """Get activity state for all activities."""
-        async with (
-            self.client() as session,
-            session.get(self.url("activities")) as response,
-        ):
-            await self.raise_on_error(response)
-            updated_activities = await response.json()
-            for updated_activity in updated_activities:
-                for activity in self.activities:
-                    if activity._id == updated_activity["entity_id"]:
-                        activity._state = updated_activity["attributes"]["state"]
+        self._activity_state_map = {
+            updated_activity["entity_id"]: updated_activity["attributes"]["state"]
+            for updated_activity in await self._get_json_conditional("activities")
+        }
+        self._activity_state_time = time.monotonic()
+        for entity_id, state in self._activity_state_map.items():
+            activity = self._activities_by_id.get(entity_id)
+            if activity:
+                activity._report_state(state)
+        return self._activity_state_map
 
     async def get_activity_groups(self) -> json:
         """Return activity groups with the list of activity IDs from Unfolded Circle Remote."""
@@ -1098,8 +1324,9 @@ class Remote:
             session.get(self.url("activity_groups?limit=100")) as response,
         ):
             await self.raise_on_error(response)
+            activity_groups = await read_json(response)
             self.activity_groups = []
-            for activity_group_data in await response.json():
+            for activity_group_data in activity_groups:
                 # _LOGGER.debug("get_activity_groups %s", json.dumps(activity_group_data, indent=2))
                 name = "DEFAULT"
                 if activity_group_data.get("name", None) and isinstance(
@@ -1112,18 +1339,29 @@ class Remote:
                     remote=self,
                     state=activity_group_data.get("state"),
                 )
-                response2 = await session.get(
-                    self.url("activity_groups/" + activity_group_data.get("group_id"))
-                )
-                await self.raise_on_error(response2)
-                activity_group_definition = await response2.json()
-                for activity in activity_group_definition.get("activities"):
-                    for local_activity in self.activities:
-                        if local_activity._id == activity.get("entity_id"):
-                            activity_group.activities.append(local_activity)
-                await response2.json()
                 self.activity_groups.append(activity_group)
-            return await response.json()
+            await asyncio.gather(
+                *[
+                    self._get_activity_group_activities(activity_group)
+                    for activity_group in self.activity_groups
+                ]
+            )
+            return activity_groups
+
+    async def _get_activity_group_activities(
+        self, activity_group: "ActivityGroup"
+    ) -> None:
+        """Attach the activities defined in the given group."""
+        async with (
+            self.client() as session,
+            session.get(self.url("activity_groups/" + activity_group.id)) as response,
+        ):
+            await self.raise_on_error(response)
+            activity_group_definition = await read_json(response)
+            for activity in activity_group_definition.get("activities"):
+                local_activity = self._activities_by_id.get(activity.get("entity_id"))
+                if local_activity:
+                    activity_group.add_activity(local_activity)
 
     async def get_remote_battery_information(self) -> json:
         """Get Battery information from remote. battery_level, battery_status, is_charging."""
@@ -1132,7 +1370,7 @@ class Remote:
             session.get(self.url("system/power/battery")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._battery_level = information["capacity"]
             self._battery_status = information["status"]
             self._is_charging = information["power_supply"]
@@ -1145,22 +1383,18 @@ class Remote:
             session.get(self.url("pub/status")) as response,
         ):
             await self.raise_on_error(response)
-            status = await response.json()
-            self._memory_total = status.get("memory").get("total_memory") / 1048576
-            self._memory_available = (
-                status.get("memory").get("available_memory") / 1048576
-            )
-
+            status = await read_json(response)
+            memory = status["memory"]
+            user_data = status["filesystem"]["user_data"]
+            self._memory_total = memory["total_memory"] * _BYTES_TO_MIB
+            self._memory_available = memory["available_memory"] * _BYTES_TO_MIB
             self._storage_total = (
-                status.get("filesystem").get("user_data").get("used")
-                + status.get("filesystem").get("user_data").get("available") / 1048576
-            )
-            self._storage_available = (
-                status.get("filesystem").get("user_data").get("available") / 1048576
-            )
+                user_data["used"] + user_data["available"]
+            ) * _BYTES_TO_MIB
+            self._storage_available = user_data["available"] * _BYTES_TO_MIB
 
-            self._cpu_load = status.get("load_avg")
-            self._cpu_load_one = status.get("load_avg").get("one")
+            self._cpu_load = status["load_avg"]
+            self._cpu_load_one = self._cpu_load["one"]
             return status
 
     async def get_remote_ambient_light_information(self) -> int:
@@ -1170,7 +1404,7 @@ class Remote:
             session.get(self.url("system/sensors/ambient_light")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             self._ambient_light_intensity = information["intensity"]
             return self._ambient_light_intensity
 
@@ -1181,7 +1415,7 @@ class Remote:
             session.get(self.url("cfg/display")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._display_auto_brightness = settings.get("auto_brightness")
             self._display_brightness = settings.get("brightness")
             return settings
@@ -1205,7 +1439,6 @@ class Remote:
             session.patch(self.url("cfg/display"), json=display_settings) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def get_remote_button_settings(self) -> str:
@@ -1215,7 +1448,7 @@ class Remote:
             session.get(self.url("cfg/button")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._button_backlight = settings.get("auto_brightness")
             self._button_backlight_brightness = settings.get("brightness")
             return settings
@@ -1239,7 +1472,6 @@ class Remote:
             session.patch(self.url("cfg/button"), json=button_settings) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def get_remote_sound_settings(self) -> str:
@@ -1249,7 +1481,7 @@ class Remote:
             session.get(self.url("cfg/sound")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._sound_effects = settings.get("enabled")
             self._sound_effects_volume = settings.get("volume")
             return settings
@@ -1273,7 +1505,6 @@ class Remote:
             session.patch(self.url("cfg/sound"), json=sound_settings) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def get_remote_haptic_settings(self) -> str:
@@ -1283,7 +1514,7 @@ class Remote:
             session.get(self.url("cfg/haptic")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._haptic_feedback = settings.get("enabled")
             return settings
 
@@ -1302,7 +1533,6 @@ class Remote:
             session.patch(self.url("cfg/haptic"), json=haptic_settings) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def get_remote_power_saving_settings(self) -> str:
@@ -1312,7 +1542,7 @@ class Remote:
             session.get(self.url("cfg/power_saving")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._display_timeout = settings.get("display_off_sec")
             self._wakeup_sensitivity = settings.get("wakeup_sensitivity")
             self._sleep_timeout = settings.get("standby_sec")
@@ -1341,7 +1571,6 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def get_remote_update_settings(self) -> str:
@@ -1351,7 +1580,7 @@ class Remote:
             session.get(self.url("cfg/software_update")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
             self._check_for_updates = settings.get("check_for_updates")
             self._automatic_updates = settings.get("auto_update")
             return settings
@@ -1365,35 +1594,9 @@ class Remote:
             session.get(self.url("system/update")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
-            self._update_in_progress = information["update_in_progress"]
-            self._sw_version = information["installed_version"]
-            download_status = ""
-            if "available" in information:
-                self._available_update = information["available"]
-                for update in self._available_update:
-                    if update.get("channel") in ["STABLE", "TESTING"]:
-                        if (
-                            self._latest_sw_version == ""
-                            or self._latest_sw_version < update.get("version")
-                        ):
-                            self._release_notes_url = update.get("release_notes_url")
-                            self._latest_sw_version = update.get("version")
-                            self._release_notes = update.get("description").get("en")
-                            download_status = update.get("download")
-                    else:
-                        self._latest_sw_version = self._sw_version
-            else:
-                self._latest_sw_version = self._sw_version
-
-            if download_status in ("PENDING", "ERROR"):
-                try:
-                    # When download status is pending, the first request to system/update
-                    # will request the download of the latest firmware but will not install
-                    response = await self.update_remote(download_only=True)
-                except HTTPError:
-                    pass
-                return information
+            information = await read_json(response)
+        await self._process_update_information(information)
+        return information
 
     async def get_remote_force_update_information(self) -> bool:
         """Force a remote firmware update check."""
@@ -1402,35 +1605,54 @@ class Remote:
             session.put(self.url("system/update")) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
-            self._update_in_progress = information["update_in_progress"]
-            self._sw_version = information["installed_version"]
-            download_status = ""
-            if "available" in information:
-                self._available_update = information["available"]
-                for update in self._available_update:
-                    if update.get("channel") in ["STABLE", "TESTING"]:
-                        if (
-                            self._latest_sw_version == ""
-                            or self._latest_sw_version < update.get("version")
-                        ):
-                            self._release_notes_url = update.get("release_notes_url")
-                            self._latest_sw_version = update.get("version")
-                            self._release_notes = update.get("description").get("en")
-                            download_status = update.get("download")
-                    else:
-                        self._latest_sw_version = self._sw_version
-            else:
-                self._latest_sw_version = self._sw_version
+            information = await read_json(response)
+        await self._process_update_information(information)
+        return information
 
-            if download_status in ("PENDING", "ERROR"):
-                try:
-                    # When download status is pending, the first request to system/update
-                    # will request the download of the latest firmware but will not install
-                    response = await self.update_remote(download_only=True)
-                except HTTPError:
-                    pass
-            return information
+    @staticmethod
+    def _parse_version(version: str | None) -> Version | None:
+        """Parse a firmware version, None when it is missing or not PEP 440."""
+        if not version:
+            return None
+        try:
+            return Version(version)
+        except InvalidVersion:
+            return None
+
+    async def _process_update_information(self, information: dict) -> None:
+        """Store system/update details and request a pending firmware download."""
+        self._update_in_progress = information["update_in_progress"]
+        self._sw_version = information["installed_version"]
+        download_status = ""
+        if "available" in information:
+            self._available_update = information["available"]
+            for update in self._available_update:
+                if update.get("channel") in ["STABLE", "TESTING"]:
+                    version = self._parse_version(update.get("version"))
+                    if version is None:
+                        _LOGGER.debug(
+                            "Ignoring update with invalid version %s",
+                            update.get("version"),
+                        )
+                        continue
+                    latest_version = self._parse_version(self._latest_sw_version)
+                    if latest_version is None or latest_version < version:
+                        self._release_notes_url = update.get("release_notes_url")
+                        self._latest_sw_version = update.get("version")
+                        self._release_notes = update.get("description").get("en")
+                        download_status = update.get("download")
+                else:
+                    self._latest_sw_version = self._sw_version
+        else:
+            self._latest_sw_version = self._sw_version
+
+        if download_status in ("PENDING", "ERROR"):
+            try:
+                # When download status is pending, the first request to system/update
+                # will request the download of the latest firmware but will not install
+                await self.update_remote(download_only=True)
+            except HTTPError:
+                pass
 
     async def get_remote_network_settings(self) -> str:
         """Get remote network settings"""
@@ -1439,7 +1661,7 @@ class Remote:
             session.get(self.url("cfg/network")) as response,
         ):
             await self.raise_on_error(response)
-            settings = await response.json()
+            settings = await read_json(response)
 
             self._bt_enabled = settings.get("bt_enabled")
             self._wifi_enabled = settings.get("wifi_enabled")
@@ -1475,7 +1697,6 @@ class Remote:
             session.patch(self.url("cfg/network"), json=network_settings) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
             return True
 
     async def update_remote(self, download_only: bool = False) -> str:
@@ -1493,7 +1714,7 @@ class Remote:
             session.post(self.url("system/update/latest")) as response,
         ):
             if response.ok:
-                information = await response.json()
+                information = await read_json(response)
                 if information.get("state") in ["DOWNLOAD", "DOWNLOADED"]:
                     self._update_in_progress = False
 
@@ -1512,22 +1733,29 @@ class Remote:
             self.client() as session,
             session.get(self.url("system/update/latest")) as response,
         ):
-            information = await response.json()
+            information = await read_json(response)
             if response.ok:
                 return information
             return {"state": "UNKNOWN"}
 
     async def get_activity_state(self, entity_id) -> str:
         """Get activity state for a remote entity."""
-        async with (
-            self.client() as session,
-            session.get(self.url("activities")) as response,
-        ):
-            await self.raise_on_error(response)
-            current_activities = await response.json()
-            for current_activity in current_activities:
-                if entity_id == current_activity["entity_id"]:
-                    return current_activity["attributes"]["state"]
+        # Reuse a recent snapshot so repeated state lookups cost one fetch
+        if time.monotonic() - self._activity_state_time < ACTIVITY_STATE_CACHE_TTL:
+            return self._activity_state_map.get(entity_id)
+        fetch = self._activity_state_fetch
+        if fetch is None or fetch.get_loop() is not asyncio.get_running_loop():
+            # Concurrent callers share one in-flight fetch
+            fetch = self._activity_state_fetch = asyncio.ensure_future(
+                self.get_activities_state()
+            )
+            fetch.add_done_callback(self._activity_state_fetched)
+        return (await asyncio.shield(fetch)).get(entity_id)
+
+    def _activity_state_fetched(self, fetch: asyncio.Task) -> None:
+        """Forget the shared activity state fetch once it has finished."""
+        if self._activity_state_fetch is fetch:
+            self._activity_state_fetch = None
 
     async def get_activity(self, entity_id) -> any:
         """Get activity state for a remote entity."""
@@ -1536,11 +1764,11 @@ class Remote:
             session.get(self.url("activities/" + entity_id)) as response,
         ):
             await self.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def post_system_command(self, cmd) -> str:
         """POST a system command to the remote."""
-        if cmd in SYSTEM_COMMANDS:
+        if cmd in SYSTEM_COMMANDS_SET:
             if self._wake_if_asleep and self._wake_on_lan:
                 if not await self.wake():
                     raise RemoteIsSleeping
@@ -1550,70 +1778,77 @@ class Remote:
                 session.post(self.url("system?cmd=" + cmd)) as response,
             ):
                 await self.raise_on_error(response)
-                response = await response.json()
+                response = await read_json(response)
                 return response
         else:
             raise SystemCommandNotFound("Invalid System Command Supplied")
 
     async def get_remotes(self) -> list:
         """Get list of remotes defined. (IR Remotes as defined by Unfolded Circle)."""
-        remote_data = {}
         async with (
             self.client() as session,
             session.get(self.url("remotes")) as response,
         ):
             await self.raise_on_error(response)
-            remotes = await response.json()
-            for remote in remotes:
+            self._remotes = [
+                {
+                    "name": remote.get("name").get("en"),
+                    "entity_id": remote.get("entity_id"),
+                }
+                for remote in await read_json(response)
                 # integration_id == uc.main : bug with web configurator
-                if remote.get("enabled") is True and remote.get(
-                    "integration_id"
-                ).startswith("uc.main"):
-                    remote_data = {
-                        "name": remote.get("name").get("en"),
-                        "entity_id": remote.get("entity_id"),
-                    }
-                    self._remotes.append(remote_data.copy())
+                if remote.get("enabled") is True
+                and remote.get("integration_id").startswith("uc.main")
+            ]
             return self._remotes
 
     async def get_custom_codesets(self) -> list:
         """Get list of IR code sets defined."""
-        ir_data = {}
         async with (
             self.client() as session,
             session.get(self.url("ir/codes/custom")) as response,
         ):
             await self.raise_on_error(response)
-            code_sets = await response.json()
-            for ir in code_sets:
-                ir_data = {
+            self._ir_custom = [
+                {
                     "device": ir.get("device"),
                     "device_id": ir.get("device_id"),
                 }
-                self._ir_custom.append(ir_data.copy())
+                for ir in await read_json(response)
+            ]
             return self._ir_custom
 
     async def get_remote_codesets(self) -> list:
         """Get list of remote codesets."""
-        ir_data = {}
         if not self._remotes:
             await self.get_remotes()
-        for remote in self._remotes:
-            async with (
-                self.client() as session,
-                session.get(
-                    self.url("remotes/" + remote.get("entity_id") + "/ir")
-                ) as response,
-            ):
-                await self.raise_on_error(response)
-                code_set = await response.json()
-                ir_data = {
-                    "name": remote.get("name"),
-                    "device_id": code_set.get("id"),
-                }
-                self._ir_codesets.append(ir_data.copy())
+        code_sets = await asyncio.gather(
+            *[self._get_remote_codeset(remote) for remote in self._remotes]
+        )
+        self._ir_codesets = [
+            {
+                "name": remote.get("name"),
+                "device_id": code_set.get("id"),
+            }
+            for remote, code_set in zip(self._remotes, code_sets)
+        ]
+        # Reversed so the first codeset wins when names repeat
+        self._ir_codesets_by_name = {
+            ir.get("name"): ir for ir in reversed(self._ir_codesets)
+        }
         return self._ir_codesets
 
+    async def _get_remote_codeset(self, remote: dict) -> dict:
+        """Get the IR codeset of a single remote."""
+        async with (
+            self.client() as session,
+            session.get(
+                self.url("remotes/" + remote.get("entity_id") + "/ir")
+            ) as response,
+        ):
+            await self.raise_on_error(response)
+            return await read_json(response)
+
     async def get_docks(self) -> list:
         """Get list of docks defined."""
         async with (
@@ -1621,7 +1856,7 @@ class Remote:
             session.get(self.url("docks")) as response,
         ):
             await self.raise_on_error(response)
-            docks = await response.json()
+            docks = await read_json(response)
             for info in docks:
                 dock = Dock(
                     dock_id=info.get("dock_id"),
@@ -1641,29 +1876,32 @@ class Remote:
                     remote_configuration_url=self.configuration_url,
                 )
                 self._docks.append(dock)
+                self._docks_by_id[dock.id] = dock
             return self._docks
 
     def get_dock_by_id(self, dock_id: str) -> Dock:
-        for dock in self._docks:
-            if dock.id == dock_id:
-                return dock
+        return self._docks_by_id.get(dock_id)
 
     async def get_ir_emitters(self) -> list:
         """Get list of docks defined."""
-        dock_data = {}
         async with (
             self.client() as session,
             session.get(self.url("ir/emitters")) as response,
         ):
             await self.raise_on_error(response)
-            docks = await response.json()
-            for dock in docks:
-                if dock.get("active") is True:
-                    dock_data = {
-                        "name": dock.get("name"),
-                        "device_id": dock.get("device_id"),
-                    }
-                    self._ir_emitters.append(dock_data.copy())
+            self._ir_emitters = [
+                {
+                    "name": dock.get("name"),
+                    "device_id": dock.get("device_id"),
+                }
+                for dock in await read_json(response)
+                if dock.get("active") is True
+            ]
+            # Reversed so the first emitter wins when names repeat
+            self._ir_emitters_by_name = {
+                (emitter.get("name") or "").lower(): emitter
+                for emitter in reversed(self._ir_emitters)
+            }
             return self._ir_emitters
 
     async def send_remote_command(
@@ -1678,10 +1916,7 @@ class Remote:
             body = {"code": kwargs.get("code"), "format": kwargs.get("format")}
         if device != "" and command != "":
             # Send a predefined code
-            ir_code = next(
-                (code for code in self._ir_codesets if code.get("name") == device),
-                None,
-            )
+            ir_code = self._ir_codesets_by_name.get(device, {})
             if ir_code:
                 codeset_id = ir_code.get("device_id")
             # Check if user sent in a delivered code
@@ -1710,17 +1945,12 @@ class Remote:
 
         if "dock" in kwargs:
             dock_name: str = kwargs.get("dock")
-            emitter = next(
-                (
-                    dock
-                    for dock in self._ir_emitters
-                    if dock.get("name", "").lower() == dock_name.lower()
-                ),
-                None,
-            )
+            emitter = self._ir_emitters_by_name.get(dock_name.lower(), {})
             emitter_id = emitter.get("device_id")
-        else:
+        elif self._ir_emitters:
             emitter_id = self._ir_emitters[0].get("device_id")
+        else:
+            emitter_id = None
 
         if emitter_id is None:
             raise NoEmitterFound("No emitter could be found with the supplied criteria")
@@ -1738,8 +1968,7 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
-            return response == 200
+            return response.status == 200
 
     async def get_ir_manufacturers(self, manufacturer: str) -> dict[str, str]:
         if self._wake_if_asleep and self._wake_on_lan:
@@ -1753,7 +1982,7 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
+            response = await read_json(response)
             return response
 
     async def get_ir_manufacturer_codesets(
@@ -1770,13 +1999,13 @@ class Remote:
             ) as response,
         ):
             await self.raise_on_error(response)
-            response = await response.json()
+            response = await read_json(response)
             return response
 
     def update_from_message(self, message: any) -> None:
         """Update internal data from received websocket messages
         data instead of polling the remote"""
-        data = json.loads(message)
+        data = json_loads(message)
         # _LOGGER.debug("RC2 received websocket message %s",data)
         try:
             # Beware when modifying this code : if an attribute is missing in one of the if clauses,
@@ -1931,9 +2160,9 @@ class Remote:
                     "entity"
                 ]
                 entity_data["entity_id"] = entity_id
-                for activity in self.activities:
-                    if activity._id == activity_id:
-                        self.update_activity_entities(activity, [entity_data])
+                activity = self._activities_by_id.get(activity_id)
+                if activity:
+                    self.update_activity_entities(activity, [entity_data])
                 self._last_update_type = RemoteUpdateType.ACTIVITY
         except (KeyError, IndexError):
             pass
@@ -1946,27 +2175,25 @@ class Remote:
                 _LOGGER.debug("Unfolded circle remote update activity")
                 new_state = data["msg_data"]["new_state"]["attributes"]["state"]
                 activity_id = data["msg_data"]["entity_id"]
-
-                for activity in self.activities:
-                    if activity._id == activity_id:
-                        activity._state = new_state
-                        # Check after included entities in activity
-                        if data["msg_data"]["new_state"].get("options") and data[
-                            "msg_data"
-                        ]["new_state"]["options"].get("included_entities"):
-                            included_entities = data["msg_data"]["new_state"][
-                                "options"
-                            ]["included_entities"]
-                            self.update_activity_entities(activity, included_entities)
+                self._activity_state_map[activity_id] = new_state
+
+                activity = self._activities_by_id.get(activity_id)
+                if activity:
+                    activity._report_state(new_state)
+                    # Check after included entities in activity
+                    if data["msg_data"]["new_state"].get("options") and data[
+                        "msg_data"
+                    ]["new_state"]["options"].get("included_entities"):
+                        included_entities = data["msg_data"]["new_state"]["options"][
+                            "included_entities"
+                        ]
+                        self.update_activity_entities(activity, included_entities)
 
                 for activity_group in self.activity_groups:
                     if activity_group.is_activity_in_group(activity_id):
                         group_state = "OFF"
-                        for activity in self.activities:
-                            if (
-                                activity_group.is_activity_in_group(activity._id)
-                                and activity.is_on()
-                            ):
+                        for activity in activity_group.activities:
+                            if activity.is_on():
                                 group_state = "ON"
                                 break
                         activity_group._state = group_state
@@ -1975,11 +2202,10 @@ class Remote:
             pass
 
     def get_entity(self, entity_id) -> any:
-        for entity in self._entities:
-            if entity._id == entity_id:
-                return entity
-        entity = UCMediaPlayerEntity(entity_id, self)
-        self._entities.append(entity)
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            entity = UCMediaPlayerEntity(entity_id, self)
+            self._entities[entity_id] = entity
         return entity
 
     async def get_entity_data(self, entity_id) -> any:
@@ -1989,7 +2215,7 @@ class Remote:
             session.get(self.url("entities/" + entity_id)) as response,
         ):
             await self.raise_on_error(response)
-            information = await response.json()
+            information = await read_json(response)
             return information
 
     def update_activity_entities(self, activity, included_entities: any):
@@ -2013,9 +2239,52 @@ class Remote:
             activity.add_mediaplayer_entity(entity)
 
     def get_activity_by_id(self, activity_id):
-        for activity in self.activities:
-            if activity_id == activity.id:
-                return activity
+        return self._activities_by_id.get(activity_id)
+
+    async def wait_activity_state(
+        self, activity: "Activity", state: str, timeout: float
+    ) -> bool:
+        """Wait until the remote reports the activity in the given state.
+
+        Only states reported by the remote count, not the optimistic state set
+        by turn_on()/turn_off(). Changes are picked up from websocket messages
+        passed to update_from_message (or a get_activities_state() poll), so
+        without a websocket feed this times out. Returns False on timeout."""
+        if activity._reported_state == state:
+            return True
+        future = asyncio.get_running_loop().create_future()
+        waiter = (state, future)
+        waiters = self._activity_state_waiters.setdefault(activity.id, [])
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._activity_state_waiters[activity.id]
+
+    def _notify_activity_state(self, activity: "Activity") -> None:
+        """Wake any wait_activity_state callers waiting for the new state."""
+        for state, future in self._activity_state_waiters.get(activity.id, ()):
+            if state == activity._reported_state and not future.done():
+                future.set_result(True)
+
+    @staticmethod
+    async def _run_tasks(coroutines, log, message: str) -> None:
+        """Run coroutines in a TaskGroup, logging failures instead of cancelling."""
+
+        async def run(coroutine) -> None:
+            try:
+                await coroutine
+            except Exception as ex:
+                log(message, ex)
+
+        async with asyncio.TaskGroup() as group:
+            for coroutine in coroutines:
+                group.create_task(run(coroutine))
 
     async def init(self):
         """Retrieves all information about the remote."""
@@ -2041,19 +2310,21 @@ class Remote:
             self.get_docks(),
             self.get_version(),
         ]
-        for coroutine in asyncio.as_completed(tasks):
-            try:
-                await coroutine
-            except Exception as ex:
-                _LOGGER.error("Unfolded circle remote initialization error %s", ex)
+        await self._run_tasks(
+            tasks, _LOGGER.error, "Unfolded circle remote initialization error %s"
+        )
 
         try:
             await self.get_activity_groups()
-            for activity_group in self.activity_groups:
-                await activity_group.update()
         except Exception as ex:
             _LOGGER.error("Unfolded circle remote initialization error %s", ex)
 
+        await self._run_tasks(
+            [activity_group.update() for activity_group in self.activity_groups],
+            _LOGGER.error,
+            "Unfolded circle remote initialization error %s",
+        )
+
         _LOGGER.debug("Unfolded circle remote data initialized")
 
     async def update(self):
@@ -2075,17 +2346,14 @@ class Remote:
             self.get_remote_network_settings(),
             self.get_activities_state(),
         ]
-        for coroutine in asyncio.as_completed(tasks):
-            try:
-                await coroutine
-            except Exception as ex:
-                _LOGGER.debug("Unfolded circle remote update error %s", ex)
-
-        for activity_group in self.activity_groups:
-            try:
-                await activity_group.update()
-            except Exception as ex:
-                _LOGGER.debug("Unfolded circle remote update error %s", ex)
+        await self._run_tasks(
+            tasks, _LOGGER.debug, "Unfolded circle remote update error %s"
+        )
+        await self._run_tasks(
+            [activity_group.update() for activity_group in self.activity_groups],
+            _LOGGER.debug,
+            "Unfolded circle remote update error %s",
+        )
         _LOGGER.debug("Unfolded circle remote data updated")
 
     async def polling_update(self):
@@ -2098,9 +2366,32 @@ class Remote:
 class UCMediaPlayerEntity:
     """Internal class to track the media player entities reported by the remote"""
 
+    __slots__ = (
+        "_id",
+        "_activity",
+        "_remote",
+        "_state",
+        "_name",
+        "_type",
+        "_source_list",
+        "_current_source",
+        "_media_title",
+        "_media_artist",
+        "_media_album",
+        "_media_type",
+        "_media_duration",
+        "_media_position",
+        "_muted",
+        "_volume",
+        "_media_image_url",
+        "_entity_commands",
+        "_media_position_updated_at",
+        "_initialized",
+    )
+
     def __init__(self, entity_id: str, remote: Remote) -> None:
         self._id = entity_id
-        self._activity = Activity
+        self._activity = None
         self._remote = remote
         self._state = "OFF"
         self._name = entity_id
@@ -2214,8 +2505,10 @@ class UCMediaPlayerEntity:
             self._state = attributes.get("state", None)
             attributes_changed["state"] = self._state
             if (
-                self._state is None or self._state == "OFF"
-            ) and self.activity.state == "ON":
+                (self._state is None or self._state == "OFF")
+                and self.activity
+                and self.activity.state == "ON"
+            ):
                 self._state = "ON"
         if attributes.get("media_image_url", None):
             self._media_image_url = attributes.get("media_image_url", None)
@@ -2261,7 +2554,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.on"}
-        if self.activity.power_command:
+        if self.activity and self.activity.power_command:
             body = self.activity.power_command
             entity_id = self.activity.power_command.get("entity_id")
         async with (
@@ -2282,7 +2575,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": self._id, "cmd_id": "media_player.off"}
-        if self.activity.power_command:
+        if self.activity and self.activity.power_command:
             body = self.activity.power_command
             entity_id = self.activity.power_command.get("entity_id")
         async with (
@@ -2323,7 +2616,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.volume_up"}
-        if self.activity.volume_up_command:
+        if self.activity and self.activity.volume_up_command:
             body = self.activity.volume_up_command
             entity_id = self.activity.volume_up_command.get("entity_id")
         async with (
@@ -2343,7 +2636,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.volume_down"}
-        if self.activity.volume_down_command:
+        if self.activity and self.activity.volume_down_command:
             body = self.activity.volume_down_command
             entity_id = self.activity.volume_down_command.get("entity_id")
         async with (
@@ -2363,7 +2656,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.mute_toggle"}
-        if self.activity.volume_mute_command:
+        if self.activity and self.activity.volume_mute_command:
             body = self.activity.volume_mute_command
             entity_id = self.activity.volume_mute_command.get("entity_id")
         async with (
@@ -2388,7 +2681,7 @@ class UCMediaPlayerEntity:
             "cmd_id": "media_player.volume",
             "params": {"volume": int_volume},
         }
-        if self.activity.volume_mute_command:
+        if self.activity and self.activity.volume_mute_command:
             entity_id = self.activity.volume_mute_command.get("entity_id")
             if "media_player." in entity_id:
                 body = {
@@ -2413,7 +2706,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.play_pause"}
-        if self.activity.play_pause_command:
+        if self.activity and self.activity.play_pause_command:
             body = self.activity.play_pause_command
             entity_id = self.activity.play_pause_command.get("entity_id")
         async with (
@@ -2433,7 +2726,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.next"}
-        if self.activity.next_track_command:
+        if self.activity and self.activity.next_track_command:
             body = self.activity.next_track_command
             entity_id = self.activity.next_track_command.get("entity_id")
         async with (
@@ -2453,7 +2746,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.previous"}
-        if self.activity.prev_track_command:
+        if self.activity and self.activity.prev_track_command:
             body = self.activity.prev_track_command
             entity_id = self.activity.prev_track_command.get("entity_id")
         async with (
@@ -2473,7 +2766,7 @@ class UCMediaPlayerEntity:
 
         entity_id = self.id
         body = {"entity_id": entity_id, "cmd_id": "media_player.stop"}
-        if self.activity.stop_command:
+        if self.activity and self.activity.stop_command:
             body = self.activity.stop_command
             entity_id = self.activity.stop_command.get("entity_id")
         async with (
@@ -2497,7 +2790,7 @@ class UCMediaPlayerEntity:
             "cmd_id": "media_player.seek",
             "params": {"media_position": position},
         }
-        if self.activity.seek_command:
+        if self.activity and self.activity.seek_command:
             body = self.activity.seek_command
             entity_id = self.activity.seek_command.get("entity_id")
         async with (
@@ -2513,12 +2806,22 @@ class UCMediaPlayerEntity:
 class ActivityGroup:
     """Class representing a Unfolded Circle Remote Activity Group."""
 
+    __slots__ = (
+        "_id",
+        "_remote",
+        "_state",
+        "_name",
+        "activities",
+        "_activities_by_id",
+    )
+
     def __init__(self, group_id: str, name: str, remote: Remote, state: str) -> None:
         self._id = group_id
         self._remote = remote
         self._state = state
         self._name = name
         self.activities: list[Activity] = []
+        self._activities_by_id: dict[str, Activity] = {}
 
     @property
     def id(self):
@@ -2535,44 +2838,67 @@ class ActivityGroup:
         """State of the Activity group."""
         return self._state
 
+    def add_activity(self, activity: "Activity") -> None:
+        """Add an activity to the group, keeping the id index in sync."""
+        if activity._id not in self._activities_by_id:
+            self.activities.append(activity)
+            self._activities_by_id[activity._id] = activity
+
     def get_activity(self, activity_id: str) -> any:
-        for activity in self.activities:
-            if activity._id == activity_id:
-                return activity
-        return None
+        return self._activities_by_id.get(activity_id)
 
     def is_activity_in_group(self, activity_id: str) -> bool:
-        if self.get_activity(activity_id):
-            return True
-        return False
+        return activity_id in self._activities_by_id
 
     async def update(self) -> None:
         """Update activity state information only for active activities."""
         # Find the best media player (if any) entity for each activity group
-        for activity in self.activities:
-            if activity.is_on():
-                await activity.update()
+        await asyncio.gather(
+            *[activity.update() for activity in self.activities if activity.is_on()]
+        )
 
 
 class Activity:
     """Class representing a Unfolded Circle Remote Activity."""
 
+    __slots__ = (
+        "_name",
+        "_id",
+        "_remote",
+        "_state",
+        "_mediaplayer_entities",
+        "_next_track_command",
+        "_prev_track_command",
+        "_volume_up_command",
+        "_volume_down_command",
+        "_volume_mute_command",
+        "_play_pause_command",
+        "_power_command",
+        "_seek_command",
+        "_stop_command",
+        "_on_body",
+        "_off_body",
+        "_command_path",
+        "_reported_state",
+    )
+
     def __init__(self, activity: str, remote: Remote) -> None:
         """Create activity."""
         self._name = activity["name"]["en"]
         self._id = activity["entity_id"]
         self._remote = remote
         self._state = activity.get("attributes").get("state")
-        self._mediaplayer_entities: list[UCMediaPlayerEntity] = []
-        self._next_track_command = None
-        self._prev_track_command = None
-        self._volume_up_command = None
-        self._volume_down_command = None
-        self._volume_mute_command = None
-        self._play_pause_command = None
-        self._power_command = None
-        self._seek_command = None
-        self._stop_command = None
+        # Last state reported by the remote, _state may be set optimistically
+        self._reported_state = self._state
+        self._reset_details()
+        # Command bodies only depend on the activity id, serialize them once
+        self._on_body = json_dumps(
+            {"entity_id": self._id, "cmd_id": "activity.on"}
+        ).encode()
+        self._off_body = json_dumps(
+            {"entity_id": self._id, "cmd_id": "activity.off"}
+        ).encode()
+        self._command_path = "entities/" + self._id + "/command"
 
     @property
     def name(self):
@@ -2657,37 +2983,30 @@ class Activity:
 
     async def turn_on(self) -> None:
         """Turn on an Activity."""
-        if self._remote._wake_if_asleep:
-            if not await self._remote.wake():
-                raise RemoteIsSleeping
-
-        body = {"entity_id": self._id, "cmd_id": "activity.on"}
-
-        async with (
-            self._remote.client() as session,
-            session.put(
-                self._remote.url("entities/" + self._id + "/command"), json=body
-            ) as response,
-        ):
-            await self._remote.raise_on_error(response)
-            self._state = "ON"
+        await self._send_command(self._on_body, "ON")
 
     async def turn_off(self) -> None:
         """Turn off an Activity."""
+        await self._send_command(self._off_body, "OFF")
+
+    async def _send_command(self, body: bytes, new_state: str) -> None:
+        """Send a pre-serialized activity command and record the new state."""
         if self._remote._wake_if_asleep:
             if not await self._remote.wake():
                 raise RemoteIsSleeping
 
-        body = {"entity_id": self._id, "cmd_id": "activity.off"}
-
         async with (
             self._remote.client() as session,
             session.put(
-                self._remote.url("entities/" + self._id + "/command"), json=body
+                self._remote.url(self._command_path),
+                data=body,
+                headers=_JSON_HEADERS,
             ) as response,
         ):
             await self._remote.raise_on_error(response)
-            self._state = "OFF"
+            self._state = new_state
+            # Keep the shared state snapshot in line with the local command
+            self._remote._activity_state_map[self._id] = new_state
 
     async def edit(self, options) -> None:
         for attribute, value in options.items():
@@ -2704,6 +3023,25 @@ class Activity:
 
         await self.update_activity(options)
 
+    def _reset_details(self) -> None:
+        """Forget the included entities and button mapping of the activity."""
+        self._mediaplayer_entities: list[UCMediaPlayerEntity] = []
+        self._next_track_command = None
+        self._prev_track_command = None
+        self._volume_up_command = None
+        self._volume_down_command = None
+        self._volume_mute_command = None
+        self._play_pause_command = None
+        self._power_command = None
+        self._seek_command = None
+        self._stop_command = None
+
+    def _report_state(self, state: str) -> None:
+        """Record a state reported by the remote and wake matching waiters."""
+        self._state = state
+        self._reported_state = state
+        self._remote._notify_activity_state(self)
+
     def is_on(self) -> bool:
         """Is Activity Running."""
         return self._state == "ON"
@@ -2716,12 +3054,13 @@ class Activity:
             ) as response,
         ):
             await self._remote.raise_on_error(response)
-            return await response.json()
+            return await read_json(response)
 
     async def update(self) -> None:
         """Update activity state information."""
         activity_info = await self._remote.get_activity(self.id)
-        self._state = activity_info["attributes"]["state"]
+        self._report_state(activity_info["attributes"]["state"])
+        updates = []
         try:
             included_entities = activity_info["options"]["included_entities"]
             for entity_info in included_entities:
@@ -2731,42 +3070,72 @@ class Activity:
                     entity = self._remote.get_entity(entity_info["entity_id"])
                     entity._entity_commands = entity_info["entity_commands"]
                     entity._name = next(iter(entity_info["name"].values()))
-                    await entity.update_data()
+                    updates.append(entity.update_data())
                 except Exception:
                     pass
         except (KeyError, IndexError):
             pass
+        # Entity refresh failures are ignored, as they were when run one by one
+        await asyncio.gather(*updates, return_exceptions=True)
 
 
-def discover_devices(apikey):
-    """Zero Conf class."""
+async def discover_devices(apikey):
+    """Discover remotes on the network via zeroconf.
 
-    class DeviceListener:
-        """Zeroconf Device Listener."""
+    This is a coroutine since 0.13.0, await it instead of running it in an executor."""
+    return RemoteGroup([remote async for remote in discover_devices_stream(apikey)])
 
-        def __init__(self) -> None:
-            """Discover devices."""
-            self.apikey = apikey
-            self.devices = []
 
-        def add_service(self, zconf, type_, name):
-            """Is Called by zeroconf when something is found."""
-            info = zconf.get_service_info(type_, name)
-            host = socket.inet_ntoa(info.addresses[0])
-            endpoint = f"http://{host}:{info.port}/api/"
-            self.devices.append(Remote(endpoint, self.apikey))
+async def discover_devices_stream(
+    apikey=None, timeout: float = ZEROCONF_TIMEOUT
+) -> AsyncIterator[Remote]:
+    """Yield remotes as they are found on the network, for up to timeout seconds.
 
-        def update_service(self, zconf, type_, name):
-            """Nothing."""
+    When stopping early, wrap the generator in contextlib.aclosing() so zeroconf
+    is shut down right away rather than when the generator is garbage collected:
+
+        async with aclosing(discover_devices_stream(apikey)) as remotes:
+            async for remote in remotes:
+                break
+    """
+    # Imported here so consumers that never discover skip loading zeroconf
+    import socket
 
-        def remove_service(self, zconf, type_, name):
-            """Nothing."""
+    from zeroconf import InterfaceChoice, ServiceStateChange
+    from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
-    zconf = zeroconf.Zeroconf(interfaces=zeroconf.InterfaceChoice.Default)
-    listener = DeviceListener()
-    zeroconf.ServiceBrowser(zconf, ZEROCONF_SERVICE_TYPE, listener)
+    aiozc = AsyncZeroconf(interfaces=InterfaceChoice.Default)
+    found: asyncio.Queue[Remote] = asyncio.Queue()
+    resolving: set[asyncio.Task] = set()
+
+    async def resolve(service_type: str, name: str) -> None:
+        info = AsyncServiceInfo(service_type, name)
+        if not await info.async_request(aiozc.zeroconf, 3000) or not info.addresses:
+            return
+        host = socket.inet_ntoa(info.addresses[0])
+        endpoint = f"http://{host}:{info.port}/api/"
+        found.put_nowait(Remote(endpoint, apikey=apikey))
+
+    def on_service_state_change(zeroconf, service_type, name, state_change) -> None:
+        if state_change is not ServiceStateChange.Added:
+            return
+        task = asyncio.ensure_future(resolve(service_type, name))
+        resolving.add(task)
+        task.add_done_callback(resolving.discard)
+
+    browser = AsyncServiceBrowser(
+        aiozc.zeroconf, ZEROCONF_SERVICE_TYPE, handlers=[on_service_state_change]
+    )
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
     try:
-        time.sleep(ZEROCONF_TIMEOUT)
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                yield await asyncio.wait_for(found.get(), remaining)
+            except asyncio.TimeoutError:
+                break
     finally:
-        zconf.close()
-    return RemoteGroup(copy.deepcopy(listener.devices))
+        await browser.async_cancel()
+        for task in resolving:
+            task.cancel()
+        await aiozc.async_close()